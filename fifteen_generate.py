@@ -0,0 +1,204 @@
+"""
+Random instance generator for the Fifteen puzzle
+Produces uniformly distributed solvable boards for any height x width
+(both at least 2), using the same solved configuration as fifteen_solve:
+the blank (zero) tile in upper left and tile col + width * row at (row, col)
+
+Boards are flat tuples in row-major order; use grid_from_board to get
+an initial_grid suitable for Puzzle(height, width, initial_grid)
+"""
+
+import array
+import random
+import struct
+import sys
+
+# constants
+FILE_MAGIC = b"FIFT"
+HEADER_FORMAT = "<4sHHI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+CHUNK_SIZE = 4096
+
+
+def permutation_parity(board):
+    """
+    Compute the parity of a permutation of range(len(board))
+    by counting its cycles
+    Returns 0 for even, 1 for odd
+    """
+    seen = [False] * len(board)
+    parity = 0
+    for start in range(len(board)):
+        if seen[start]:
+            continue
+        length = 0
+        pos = start
+        while not seen[pos]:
+            seen[pos] = True
+            pos = board[pos]
+            length += 1
+        parity ^= (length - 1) & 1
+    return parity
+
+
+def is_solvable(board, puzzle_width):
+    """
+    Check whether a flat board can be slid back to the solved configuration
+    The permutation parity must match the parity of the blank's
+    taxicab distance from its solved position (0, 0)
+    Returns a boolean
+    """
+    zero_pos = list(board).index(0)
+    zero_row, zero_col = zero_pos // puzzle_width, zero_pos % puzzle_width
+    return permutation_parity(board) == (zero_row + zero_col) % 2
+
+
+class BoardGenerator:
+    """
+    Seeded generator of uniformly random solvable boards
+    """
+
+    def __init__(self, puzzle_height, puzzle_width, seed=None):
+        """
+        Initialize generator for the given board size
+        The same seed always yields the same sequence of boards
+        """
+        assert puzzle_height >= 2 and puzzle_width >= 2, \
+            "board must be at least 2x2"
+        self._height = puzzle_height
+        self._width = puzzle_width
+        self._size = puzzle_height * puzzle_width
+        self._rng = random.Random(seed)
+
+    def get_height(self):
+        """
+        Getter for board height
+        Returns an integer
+        """
+        return self._height
+
+    def get_width(self):
+        """
+        Getter for board width
+        Returns an integer
+        """
+        return self._width
+
+    def next_board(self):
+        """
+        Shuffle all tiles uniformly, then swap tiles 1 and 2 if the result
+        is unsolvable; the swap keeps the blank in place and flips parity,
+        so it pairs each unsolvable board with exactly one solvable one
+        Returns a flat list of integers
+        """
+        board = list(range(self._size))
+        rand = self._rng.random
+        # Fisher-Yates written out rather than random.shuffle, whose
+        # index selection differs between Python versions
+        for idx in range(self._size - 1, 0, -1):
+            other = int(rand() * (idx + 1))
+            board[idx], board[other] = board[other], board[idx]
+
+        if not is_solvable(board, self._width):
+            pos1 = board.index(1)
+            pos2 = board.index(2)
+            board[pos1], board[pos2] = 2, 1
+        return board
+
+    def generate(self, count):
+        """
+        Generate count boards one at a time
+        Returns an iterator of flat lists
+        """
+        for dummy_idx in range(count):
+            yield self.next_board()
+
+    def generate_block(self, count):
+        """
+        Generate count boards packed back to back in a single array
+        Returns an array.array of length count * height * width
+        """
+        block = array.array(_typecode(self._size))
+        for dummy_idx in range(count):
+            block.extend(self.next_board())
+        return block
+
+
+def grid_from_board(board, puzzle_width):
+    """
+    Convert a flat board into the nested list form used by Puzzle
+    Returns a list of lists
+    """
+    return [list(board[row * puzzle_width:(row + 1) * puzzle_width])
+            for row in range(len(board) // puzzle_width)]
+
+
+def _typecode(size):
+    """
+    Pick the smallest array typecode able to hold tiles 0..size-1
+    Returns a string
+    """
+    if size <= 256:
+        return "B"
+    assert size <= 65536, "board too large: " + str(size) + " tiles"
+    return "H"
+
+
+def write_boards(filename, puzzle_height, puzzle_width, count, seed=None):
+    """
+    Generate count boards and write them to a compact binary file:
+    a little-endian header (magic, height, width, count) followed by
+    one unsigned byte per tile, or two for boards over 256 tiles
+    """
+    generator = BoardGenerator(puzzle_height, puzzle_width, seed)
+    with open(filename, "wb") as out_file:
+        out_file.write(struct.pack(HEADER_FORMAT, FILE_MAGIC,
+                                   puzzle_height, puzzle_width, count))
+        remaining = count
+        while remaining > 0:
+            block = generator.generate_block(min(remaining, CHUNK_SIZE))
+            if block.itemsize > 1 and sys.byteorder == "big":
+                block.byteswap()
+            out_file.write(block.tostring() if sys.version_info[0] < 3
+                           else block.tobytes())
+            remaining -= CHUNK_SIZE
+
+
+def read_boards(filename):
+    """
+    Read boards written by write_boards
+    Returns a tuple (height, width, iterator of flat tuples)
+    """
+    in_file = open(filename, "rb")
+    magic, height, width, count = struct.unpack(HEADER_FORMAT,
+                                                in_file.read(HEADER_SIZE))
+    assert magic == FILE_MAGIC, "not a board file: " + filename
+    size = height * width
+
+    def boards():
+        """
+        Yield boards chunk by chunk, closing the file when done
+        """
+        try:
+            remaining = count
+            while remaining > 0:
+                block = array.array(_typecode(size))
+                block.fromfile(in_file, min(remaining, CHUNK_SIZE) * size)
+                if block.itemsize > 1 and sys.byteorder == "big":
+                    block.byteswap()
+                for start in range(0, len(block), size):
+                    yield tuple(block[start:start + size])
+                remaining -= CHUNK_SIZE
+        finally:
+            in_file.close()
+
+    return height, width, boards()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (5, 6):
+        print("usage: fifteen_generate.py FILE HEIGHT WIDTH COUNT [SEED]")
+        sys.exit(1)
+    write_boards(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]),
+                 int(sys.argv[4]),
+                 int(sys.argv[5]) if len(sys.argv) == 6 else None)